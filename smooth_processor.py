@@ -1,18 +1,192 @@
 """
-Smooth Real-Time Audio Processor with Ring Buffer
-Uses a ring buffer to prevent crackling and underruns
+Smooth Real-Time Audio Processor with Full-Duplex Stream
+Mixes each input block straight into the output block to prevent
+crackling, underruns and queueing latency
 """
 
 import numpy as np
 import sounddevice as sd
 import threading
-import queue
+import collections
+import ctypes
+from ctypes import wintypes
 import msvcrt
+import llvmlite.binding as llvm
+from numba import njit, prange
+from numba.core import config as numba_config
+
+# Block sizes the stream may step through when it keeps underrunning
+BLOCK_SIZES = (128, 256, 512, 1024, 2048, 4096)
+
+# More xruns than this in one supervisor window doubles the block size
+XRUN_LIMIT = 2
+XRUN_WINDOW_MS = 500
+
+# Win32 SetThreadPriority level for the keyboard thread
+THREAD_PRIORITY_BELOW_NORMAL = -1
+
+# MMCSS (Multimedia Class Scheduler) entry points for the audio thread
+_avrt = ctypes.windll.avrt
+_avrt.AvSetMmThreadCharacteristicsW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(wintypes.DWORD)]
+_avrt.AvSetMmThreadCharacteristicsW.restype = wintypes.HANDLE
+_avrt.AvRevertMmThreadCharacteristics.argtypes = [wintypes.HANDLE]
+_avrt.AvRevertMmThreadCharacteristics.restype = wintypes.BOOL
+
+
+def _mixer_target():
+    """CPU name and widest SIMD instruction set Numba compiles the mixer for
+    
+    Honors NUMBA_CPU_NAME / NUMBA_CPU_FEATURES the same way Numba's own
+    code generator does, falling back to the host CPU.
+    """
+    cpu_name = numba_config.CPU_NAME or llvm.get_host_cpu_name()
+    if numba_config.CPU_FEATURES is not None:
+        enabled = {feature[1:] for feature in numba_config.CPU_FEATURES.split(',')
+                   if feature.startswith('+')}
+    else:
+        enabled = {name for name, on in llvm.get_host_cpu_features().items() if on}
+    for isa in ('avx512f', 'avx2', 'sse4.1', 'neon'):
+        if isa in enabled:
+            return cpu_name, isa.upper()
+    return cpu_name, 'scalar'
+
+
+def _callback_flag_bits(status):
+    """Raw PortAudio status bits of a sounddevice CallbackFlags object
+    
+    CallbackFlags has no public int conversion; its private `_flags` is
+    the only way to get the bits without allocating, so it is read here
+    in one place.
+    """
+    return status._flags
+
+
+def _aligned_empty(n, dtype=np.float32, align=64):
+    """Uninitialized 1-D array whose data starts on an `align`-byte boundary"""
+    nbytes = n * np.dtype(dtype).itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -raw.ctypes.data % align
+    return raw[offset:offset + nbytes].view(dtype)
+
+
+# Full-scale value of the int16 output samples
+INT16_FULL_SCALE = 32767.0
+
+
+# Fused mixer kernels: vocal removal + center extraction + volume + clip +
+# int16 quantization in one pass. Each variant only carries the terms its
+# coefficients need; all share one signature so the caller can pick one per
+# block via _select_fuse. Every operand is float32 so LLVM packs 8 lanes per
+# AVX2 register instead of widening the whole loop to float64, and the int16
+# scale is folded into the gains so it costs nothing per sample. They keep
+# the GIL: a block is sub-microsecond work, and releasing it would only add a
+# point where the audio thread must win the GIL back. The explicit signature
+# makes Numba compile them eagerly at import (or load them from the on-disk
+# cache), so no JIT pause can ever land inside an audio callback.
+
+_FUSE_SIG = "void(float32[::1], float32[::1], int16[:, ::1], float32, float32, float32)"
+
+
+@njit(inline='always', fastmath=True)
+def _to_int16(m):
+    """Branchless clip to int16 full scale, round to nearest and convert
+    
+    Rounding (vroundps) before the conversion avoids the truncation dead
+    zone around zero that a bare float->int cast would add.
+    """
+    full_scale = np.float32(INT16_FULL_SCALE)
+    return np.int16(np.rint(min(max(m, -full_scale), full_scale)))
+
+
+@njit(_FUSE_SIG, cache=True, fastmath=True, boundscheck=False)
+def _fuse_vc(left_in, right_in, out, vrm, half_cen, master):
+    """Vocal removal and center extraction both active"""
+    side_gain = np.float32(vrm) * np.float32(master) * np.float32(INT16_FULL_SCALE)
+    mid_gain = np.float32(half_cen) * np.float32(master) * np.float32(INT16_FULL_SCALE)
+    n = left_in.shape[0]
+    for i in range(n):
+        left = left_in[i]
+        right = right_in[i]
+        m = (left - right) * side_gain + (left + right) * mid_gain
+        q = _to_int16(m)
+        out[i, 0] = q
+        out[i, 1] = q
+
+
+@njit(_FUSE_SIG, cache=True, fastmath=True, boundscheck=False)
+def _fuse_v(left_in, right_in, out, vrm, half_cen, master):
+    """Vocal removal only (center attenuation dialed to zero)"""
+    side_gain = np.float32(vrm) * np.float32(master) * np.float32(INT16_FULL_SCALE)
+    n = left_in.shape[0]
+    for i in range(n):
+        m = (left_in[i] - right_in[i]) * side_gain
+        q = _to_int16(m)
+        out[i, 0] = q
+        out[i, 1] = q
+
+
+@njit(_FUSE_SIG, cache=True, fastmath=True, boundscheck=False)
+def _fuse_c(left_in, right_in, out, vrm, half_cen, master):
+    """Center extraction only (vocal removal mix dialed to zero)"""
+    mid_gain = np.float32(half_cen) * np.float32(master) * np.float32(INT16_FULL_SCALE)
+    n = left_in.shape[0]
+    for i in range(n):
+        m = (left_in[i] + right_in[i]) * mid_gain
+        q = _to_int16(m)
+        out[i, 0] = q
+        out[i, 1] = q
+
+
+@njit(_FUSE_SIG, cache=True, fastmath=True, boundscheck=False)
+def _fuse_mute(left_in, right_in, out, vrm, half_cen, master):
+    """Every gain is zero - the mix is silence"""
+    out[:left_in.shape[0]] = 0
+
+
+def _select_fuse(vrm, half_cen, master):
+    """Pick the cheapest mixer kernel for the current coefficients"""
+    if master == 0.0 or (vrm == 0.0 and half_cen == 0.0):
+        return _fuse_mute
+    if half_cen == 0.0:
+        return _fuse_v
+    if vrm == 0.0:
+        return _fuse_c
+    return _fuse_vc
+
+
+@njit("void(float32[:, ::1], float32[:, ::1], int16[:, ::1], float32, float32, float32)",
+      parallel=True, cache=True, fastmath=True, boundscheck=False)
+def _fuse_multi(indata, mix, out, vrm, half_cen, master):
+    """Multi-stream mixer: one stereo pair per stream, summed to stereo out
+    
+    Each stream's pair is mixed into its own row of `mix` in parallel, then
+    the rows are summed, scaled by master volume, clipped and quantized.
+    """
+    num_streams = mix.shape[0]
+    n = indata.shape[0]
+    side_gain = np.float32(vrm)
+    mid_gain = np.float32(half_cen)
+    for s in prange(num_streams):
+        for i in range(n):
+            left = indata[i, 2 * s]
+            right = indata[i, 2 * s + 1]
+            mix[s, i] = (left - right) * side_gain + (left + right) * mid_gain
+    
+    gain = np.float32(master) * np.float32(INT16_FULL_SCALE)
+    for i in range(n):
+        m = np.float32(0.0)
+        for s in range(num_streams):
+            m += mix[s, i]
+        q = _to_int16(m * gain)
+        out[i, 0] = q
+        out[i, 1] = q
+
 
 class SmoothAudioProcessor:
-    def __init__(self, sample_rate=44100, block_size=4096):
+    def __init__(self, sample_rate=44100, block_size=256, num_streams=1):
         self.sample_rate = sample_rate
         self.block_size = block_size
+        self.num_streams = num_streams  # Stereo sources (stems/decks) on the input
         self.is_running = False
         
         # Processing parameters
@@ -20,12 +194,58 @@ class SmoothAudioProcessor:
         self.vocal_removal_mix = 1.0
         self.master_volume = 1.0
         
-        # Thread-safe queue with larger buffer
-        self.audio_queue = queue.Queue(maxsize=50)
+        # Contiguous per-channel buffers (SoA) so the mixer runs on
+        # unit-stride data instead of the interleaved (N, 2) input
+        self._allocate_buffers()
         
-        # Lock for thread-safe parameter updates
+        # Running xrun count, only ever incremented by the audio callback
+        self._xruns = 0
+        
+        # Status flags and recent exceptions collected by the audio callback,
+        # printed later by the supervisor loop so the callback never blocks.
+        # Only the callback writes the status accumulators; the reporter
+        # diffs them against its own last-seen count.
+        self._status_flags = 0
+        self._status_events = 0
+        self._reported_events = 0
+        self._errors = collections.deque(maxlen=16)
+        
+        # MMCSS handle of the audio thread (None until the first callback)
+        self._mmcss_handle = None
+        
+        # Lock serializing parameter writers (keyboard thread)
         self.param_lock = threading.Lock()
         
+        # Published copy of the parameters for the audio callback:
+        # (center_attenuation / 2, vocal_removal_mix, master_volume). It is
+        # an immutable tuple swapped in with one reference store, which is
+        # atomic under the GIL, so the reader never locks or retries. The
+        # center halving is done here, once per key press.
+        self._params = None
+        self._publish_params()
+        
+    def _allocate_buffers(self):
+        """(Re)allocate the per-channel buffers for the current block size
+        
+        Cache-line aligned so the vectorized mixer loop never splits a
+        load across two lines.
+        """
+        self._L = _aligned_empty(self.block_size)
+        self._R = _aligned_empty(self.block_size)
+        
+        # Per-stream mono mixes, one row per stream, for multi-stream input
+        self._M = np.empty((self.num_streams, self.block_size), dtype=np.float32)
+        
+    def _publish_params(self):
+        """Publish current parameters to the audio thread (writer side)"""
+        self._params = (0.5 * self.center_attenuation,
+                        self.vocal_removal_mix,
+                        self.master_volume)
+        
+    def _snapshot_params(self):
+        """Wait-free consistent read of the published parameters"""
+        return self._params
+        
     def list_audio_devices(self):
         """List all available audio devices"""
         print("\n=== Available Audio Devices ===")
@@ -41,69 +261,79 @@ class SmoothAudioProcessor:
             print(f"{i}: {device['name']}{marker}")
         print("================================\n")
         
-    def process_audio(self, audio_data):
-        """Process stereo audio to create the mixed output"""
-        if len(audio_data.shape) < 2 or audio_data.shape[1] < 2:
-            # Mono audio - convert to stereo
-            mono = audio_data[:, 0] if len(audio_data.shape) > 1 else audio_data
-            return np.column_stack([mono, mono])
-            
-        # Extract left and right channels
-        left = audio_data[:, 0]
-        right = audio_data[:, 1]
+    def process_audio(self, indata_multi, out):
+        """Process float32 audio into the int16 stereo buffer `out`
         
-        with self.param_lock:
-            # Stream 1: Vocal Removal (L - R)
-            vocal_removed = (left - right) * self.vocal_removal_mix
-            
-            # Stream 2: Center Extraction at configurable attenuation
-            center = ((left + right) / 2.0) * self.center_attenuation
-            
-            # Mix both streams together
-            mixed = vocal_removed + center
-            
-            # Apply master volume
-            mixed = mixed * self.master_volume
+        `indata_multi` is (frames, 2 * num_streams): one stereo pair per
+        stream, all mixed down to a single stereo output.
+        """
+        # Snapshot parameters without taking a lock on the audio thread
+        half_cen, vrm, master = self._snapshot_params()
         
-        # Soft limiting to prevent clipping
-        mixed = np.clip(mixed, -1.0, 1.0)
+        if len(indata_multi.shape) < 2 or indata_multi.shape[1] < 2:
+            # Mono audio - apply master volume, clip to int16 full scale and
+            # round like the stereo kernels, then convert to stereo
+            mono = indata_multi[:, 0] if len(indata_multi.shape) > 1 else indata_multi
+            scaled = self._L[:mono.shape[0]]
+            np.multiply(mono, master * INT16_FULL_SCALE, out=scaled)
+            np.clip(scaled, -INT16_FULL_SCALE, INT16_FULL_SCALE, out=scaled)
+            np.rint(scaled, out=scaled)
+            out[:, 0] = scaled
+            out[:, 1] = scaled
+            return out
         
-        # Create stereo output
-        output = np.column_stack([mixed, mixed])
+        if indata_multi.shape[1] != 2 * self.num_streams:
+            # The kernels run without bounds checks, so never let them see a
+            # block that does not hold exactly one stereo pair per stream
+            raise ValueError(f"expected {2 * self.num_streams} input channels "
+                             f"({self.num_streams} stereo streams), got {indata_multi.shape[1]}")
         
-        return output
-    
-    def input_callback(self, indata, frames, time, status):
-        """Input callback - captures and processes audio"""
-        if status:
-            print(f"Input status: {status}")
+        if self.num_streams > 1:
+            # Several stereo streams - mix them in parallel, one per thread
+            _fuse_multi(indata_multi, self._M, out, vrm, half_cen, master)
+            return out
         
-        try:
-            # Process the audio
-            processed = self.process_audio(indata.copy())
-            
-            # Put in queue (non-blocking, drop if queue full)
-            try:
-                self.audio_queue.put_nowait(processed)
-            except queue.Full:
-                pass  # Drop frame if queue is full
-                
-        except Exception as e:
-            print(f"Processing error: {e}")
+        # De-interleave once, then vocal removal (L - R) + center extraction,
+        # volume, clip and the interleaved int16 stereo store in one pass
+        np.copyto(self._L, indata_multi[:, 0])
+        np.copyto(self._R, indata_multi[:, 1])
+        fuse = _select_fuse(vrm, half_cen, master)
+        fuse(self._L, self._R, out, vrm, half_cen, master)
+        
+        return out
     
-    def output_callback(self, outdata, frames, time, status):
-        """Output callback - plays processed audio"""
+    def _duplex_cb(self, indata, outdata, frames, time, status):
+        """Full-duplex callback - mixes the captured block straight into the output"""
+        if self._mmcss_handle is None:
+            self._enter_mmcss()
+        
         if status:
-            print(f"Output status: {status}")
+            if (status.input_overflow or status.input_underflow
+                    or status.output_underflow or status.output_overflow):
+                self._xruns += 1
+            self._status_flags |= _callback_flag_bits(status)
+            self._status_events += 1
         
         try:
-            # Get processed audio from queue
-            data = self.audio_queue.get_nowait()
-            outdata[:] = data
-        except queue.Empty:
-            # No data available - output silence
+            self.process_audio(indata, outdata)
+        except Exception as e:
+            # Keep only type and args: the live exception's traceback would
+            # pin this frame and its views of PortAudio's reused buffers
+            self._errors.append((type(e), e.args))
             outdata.fill(0)
     
+    def _report_status(self):
+        """Print stream status and errors collected by the audio callback"""
+        events = self._status_events
+        if events != self._reported_events:
+            print(f"Stream status: {events - self._reported_events} flagged callbacks "
+                  f"(flags seen: {sd.CallbackFlags(self._status_flags)})")
+            self._reported_events = events
+        while self._errors:
+            exc_type, exc_args = self._errors.popleft()
+            message = exc_args[0] if len(exc_args) == 1 else exc_args
+            print(f"Processing error: {exc_type.__name__}: {message}")
+    
     def display_controls(self):
         """Display current settings and controls"""
         print("\n" + "="*60)
@@ -123,42 +353,92 @@ class SmoothAudioProcessor:
     
     def keyboard_listener(self):
         """Listen for keyboard input to adjust parameters"""
+        # Run the UI below normal priority so it never preempts the audio thread
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
+        
         while self.is_running:
-            if msvcrt.kbhit():
-                key = msvcrt.getch().decode('utf-8').lower()
+            # Blocks until a key is pressed - no busy polling
+            key = msvcrt.getwch()
+            if key in ('\x00', '\xe0'):
+                # Arrow/function/navigation key: discard its scan code so
+                # e.g. PageDown ('Q') or Insert ('R') is not taken as a command
+                msvcrt.getwch()
+                continue
+            key = key.lower()
+            
+            with self.param_lock:
+                # Steps are rounded to the 5% grid so repeated presses land
+                # exactly on 0.0 and the zero-gain mixer kernels get selected
+                if key == '1':
+                    self.center_attenuation = max(0.0, round(self.center_attenuation - 0.05, 2))
+                    print(f"Center Attenuation: {self.center_attenuation*100:.0f}%")
+                elif key == '2':
+                    self.center_attenuation = min(1.0, round(self.center_attenuation + 0.05, 2))
+                    print(f"Center Attenuation: {self.center_attenuation*100:.0f}%")
+                elif key == '3':
+                    self.vocal_removal_mix = max(0.0, round(self.vocal_removal_mix - 0.1, 2))
+                    print(f"Vocal Removal Mix: {self.vocal_removal_mix*100:.0f}%")
+                elif key == '4':
+                    self.vocal_removal_mix = min(1.0, round(self.vocal_removal_mix + 0.1, 2))
+                    print(f"Vocal Removal Mix: {self.vocal_removal_mix*100:.0f}%")
+                elif key == '5':
+                    self.master_volume = max(0.0, round(self.master_volume - 0.05, 2))
+                    print(f"Master Volume: {self.master_volume*100:.0f}%")
+                elif key == '6':
+                    self.master_volume = min(1.5, round(self.master_volume + 0.05, 2))
+                    print(f"Master Volume: {self.master_volume*100:.0f}%")
+                elif key == 'r':
+                    self.center_attenuation = 0.6
+                    self.vocal_removal_mix = 1.0
+                    self.master_volume = 1.0
+                    print("Settings reset to defaults")
+                    self.display_controls()
+                elif key == 'q':
+                    print("\nStopping...")
+                    self.is_running = False
+                    break
                 
-                with self.param_lock:
-                    if key == '1':
-                        self.center_attenuation = max(0.0, self.center_attenuation - 0.05)
-                        print(f"Center Attenuation: {self.center_attenuation*100:.0f}%")
-                    elif key == '2':
-                        self.center_attenuation = min(1.0, self.center_attenuation + 0.05)
-                        print(f"Center Attenuation: {self.center_attenuation*100:.0f}%")
-                    elif key == '3':
-                        self.vocal_removal_mix = max(0.0, self.vocal_removal_mix - 0.1)
-                        print(f"Vocal Removal Mix: {self.vocal_removal_mix*100:.0f}%")
-                    elif key == '4':
-                        self.vocal_removal_mix = min(1.0, self.vocal_removal_mix + 0.1)
-                        print(f"Vocal Removal Mix: {self.vocal_removal_mix*100:.0f}%")
-                    elif key == '5':
-                        self.master_volume = max(0.0, self.master_volume - 0.05)
-                        print(f"Master Volume: {self.master_volume*100:.0f}%")
-                    elif key == '6':
-                        self.master_volume = min(1.5, self.master_volume + 0.05)
-                        print(f"Master Volume: {self.master_volume*100:.0f}%")
-                    elif key == 'r':
-                        self.center_attenuation = 0.6
-                        self.vocal_removal_mix = 1.0
-                        self.master_volume = 1.0
-                        print("Settings reset to defaults")
-                        self.display_controls()
-                    elif key == 'q':
-                        print("\nStopping...")
-                        self.is_running = False
-                        break
+                self._publish_params()
+    
+    def _enter_mmcss(self):
+        """Register the calling audio thread with MMCSS as "Pro Audio"
+        
+        Done once per stream from inside its first callback; a failed
+        registration is stored as 0 so it is not retried every block.
+        """
+        task_index = wintypes.DWORD(0)
+        handle = _avrt.AvSetMmThreadCharacteristicsW("Pro Audio", ctypes.byref(task_index))
+        self._mmcss_handle = handle or 0
+    
+    def _leave_mmcss(self):
+        """Stream finished callback - drop the audio thread's MMCSS class"""
+        if self._mmcss_handle:
+            _avrt.AvRevertMmThreadCharacteristics(self._mmcss_handle)
+        self._mmcss_handle = None
+    
+    def _supervise_xruns(self):
+        """Watch the xrun rate; grow the block size when it is too high
+        
+        Returns early with self.block_size raised so the caller reopens the
+        stream at the new size; otherwise returns once processing stops.
+        """
+        seen = self._xruns
+        while self.is_running:
+            sd.sleep(XRUN_WINDOW_MS)
+            self._report_status()
+            xruns = self._xruns
+            if xruns - seen > XRUN_LIMIT:
+                larger = [size for size in BLOCK_SIZES if size > self.block_size]
+                if larger:
+                    self.block_size = larger[0]
+                    print(f"{xruns - seen} xruns in {XRUN_WINDOW_MS} ms - "
+                          f"increasing block size to {self.block_size}")
+                    return
+            seen = xruns
     
     def start_processing(self, input_device=None, output_device=None):
-        """Start real-time audio processing with separate input/output streams"""
+        """Start real-time audio processing with a full-duplex stream"""
         self.display_controls()
         
         self.is_running = True
@@ -167,32 +447,32 @@ class SmoothAudioProcessor:
         keyboard_thread = threading.Thread(target=self.keyboard_listener, daemon=True)
         keyboard_thread.start()
         
-        # Pre-fill queue with silence
-        silence = np.zeros((self.block_size, 2), dtype=np.float32)
-        for _ in range(20):
-            self.audio_queue.put(silence)
+        cpu_name, isa = _mixer_target()
+        print(f"Mixer compiled for {cpu_name} ({isa})\n")
         
         try:
-            # Separate input and output streams for better stability
-            with sd.InputStream(
-                device=input_device,
-                samplerate=self.sample_rate,
-                blocksize=self.block_size,
-                channels=2,
-                callback=self.input_callback,
-                dtype=np.float32
-            ), sd.OutputStream(
-                device=output_device,
-                samplerate=self.sample_rate,
-                blocksize=self.block_size,
-                channels=2,
-                callback=self.output_callback,
-                dtype=np.float32,
-                prime_output_buffers_using_stream_callback=False
-            ):
-                print("Processing... (Press Q to quit)\n")
-                while self.is_running:
-                    sd.sleep(100)
+            while self.is_running:
+                self._allocate_buffers()
+                
+                # Single full-duplex stream: input and output share one callback,
+                # so there is no queue between them and latency is one block each way
+                with sd.Stream(
+                    device=(input_device, output_device),
+                    samplerate=self.sample_rate,
+                    blocksize=self.block_size,
+                    channels=(2 * self.num_streams, 2),
+                    callback=self._duplex_cb,
+                    finished_callback=self._leave_mmcss,
+                    dtype=(np.float32, np.int16),  # Float capture, int16 playback
+                    prime_output_buffers_using_stream_callback=False
+                ):
+                    latency_ms = 1000.0 * self.block_size / self.sample_rate
+                    print(f"Processing at {self.block_size} frames/block "
+                          f"({latency_ms:.1f} ms)... (Press Q to quit)\n")
+                    self._supervise_xruns()
+                
+                # Print anything the callback collected in the last window
+                self._report_status()
                     
         except KeyboardInterrupt:
             print("\nStopping audio processor...")
@@ -205,7 +485,7 @@ class SmoothAudioProcessor:
 
 
 def main():
-    processor = SmoothAudioProcessor(sample_rate=44100, block_size=4096)
+    processor = SmoothAudioProcessor(sample_rate=44100, block_size=BLOCK_SIZES[1])
     
     devices = sd.query_devices()
     
@@ -226,13 +506,25 @@ def main():
                 print(f"Using INPUT: {dev['name']}")
                 break
     
+    # A full-duplex stream needs both devices on the same host API
+    # (MME, DirectSound, WASAPI, ...), so only offer outputs from the input's
+    if input_device is not None:
+        hostapi = devices[input_device]['hostapi']
+    else:
+        try:
+            hostapi = sd.query_devices(kind='input')['hostapi']
+        except sd.PortAudioError:
+            print("\n⚠ Error: No input device available. Install VB-CABLE or enable Stereo Mix.")
+            return
+    hostapi_info = sd.query_hostapis(hostapi)
+    
     # Show only output devices for user selection
     print("\n" + "="*60)
-    print("  Available OUTPUT Devices:")
+    print(f"  Available OUTPUT Devices ({hostapi_info['name']}):")
     print("="*60)
     output_devices = []
     for i, dev in enumerate(devices):
-        if dev['max_output_channels'] >= 2:
+        if dev['max_output_channels'] >= 2 and dev['hostapi'] == hostapi:
             output_devices.append(i)
             print(f"  [{len(output_devices)-1}] {dev['name']}")
     print("="*60)
@@ -247,7 +539,9 @@ def main():
         print(f"\nUsing OUTPUT: {device_info['name']}")
         print(f"Sample rate: {processor.sample_rate} Hz\n")
     else:
-        output_device = None
+        # Default output of the input's host API (None if it has none)
+        default_output = hostapi_info['default_output_device']
+        output_device = default_output if default_output >= 0 else None
         print("\nUsing default output device\n")
     
     # Start processing